@@ -146,7 +146,7 @@ async def d3_api_aplugin(
         PluginException: If the plugin execution fails.
     """
     if logger.isEnabledFor(logging.DEBUG):
-        logger.debug(f"Send plugin api:{payload.debug_string()}")
+        logger.debug("Send plugin api:%s", payload.debug_string())
     response: Any = await d3_api_arequest(
         Method.POST,
         hostname,
@@ -161,7 +161,7 @@ async def d3_api_aplugin(
         if plugin_response.pythonLog:
             print(plugin_response.pythonLog)
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"PluginResponse:{plugin_response.debug_string()}")
+            logger.debug("PluginResponse:%s", plugin_response.debug_string())
 
         return plugin_response
     except ValidationError:
@@ -193,7 +193,7 @@ async def d3_api_aregister_module(
     """
     try:
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"Register module:{payload.debug_string()}")
+            logger.debug("Register module:%s", payload.debug_string())
         response: Any = await d3_api_arequest(
             Method.POST,
             hostname,
@@ -241,7 +241,7 @@ def d3_api_plugin(
     """
 
     if logger.isEnabledFor(logging.DEBUG):
-        logger.debug(f"Send plugin api:{payload.debug_string()}")
+        logger.debug("Send plugin api:%s", payload.debug_string())
     response = d3_api_request(
         Method.POST,
         hostname,
@@ -257,7 +257,7 @@ def d3_api_plugin(
         if plugin_response.pythonLog:
             print(plugin_response.pythonLog)
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"PluginResponse:{plugin_response.debug_string()}")
+            logger.debug("PluginResponse:%s", plugin_response.debug_string())
 
         return plugin_response
     except ValidationError:
@@ -292,7 +292,7 @@ def d3_api_register_module(
     """
     try:
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"Register module:{payload.debug_string()}")
+            logger.debug("Register module:%s", payload.debug_string())
         response: Any = d3_api_request(
             Method.POST,
             hostname,
@@ -4,10 +4,13 @@ Copyright (c) 2025 Disguise Technologies ltd
 """
 
 import ast
+import functools
 import inspect
 import textwrap
 import types
+from collections.abc import Callable
 from typing import Any
+from weakref import WeakKeyDictionary
 
 
 ###############################################################################
@@ -290,6 +293,35 @@ def convert_class_to_py27(class_node: ast.ClassDef) -> None:
 
 ###############################################################################
 # Signature validation utilities
+_SIGNATURE_CACHE: "WeakKeyDictionary[Callable[..., Any], inspect.Signature]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_signature(func: Callable[..., Any]) -> inspect.Signature:
+    """Return the signature of a function, computing it only once per function.
+
+    inspect.signature() unwraps decorators and builds Parameter objects on every
+    call; functions called repeatedly through the validation utilities reuse the
+    cached result instead. Entries are dropped when the function is garbage
+    collected.
+
+    Args:
+        func: The function to get the signature of
+
+    Returns:
+        The function's signature
+    """
+    try:
+        return _SIGNATURE_CACHE[func]
+    except KeyError:
+        sig = _SIGNATURE_CACHE[func] = inspect.signature(func)
+        return sig
+    except TypeError:
+        # Not weak-referenceable (e.g. some builtins), nothing to cache against
+        return inspect.signature(func)
+
+
 def validate_and_bind_signature(
     sig: inspect.Signature, *args: Any, **kwargs: Any
 ) -> inspect.BoundArguments:
@@ -316,8 +348,7 @@ def validate_and_bind_signature(
 
 
 def validate_and_extract_args(
-    sig: inspect.Signature,
-    exclude_self: bool,
+    sig: inspect.Signature | Callable[..., Any],
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
 ) -> tuple[tuple[Any, ...], dict[str, Any]]:
@@ -325,10 +356,13 @@ def validate_and_extract_args(
 
     This is a shared utility that validates arguments against a signature and
     separates them into positional and keyword arguments for remote execution.
+    When given the function itself, validation is delegated to a binder built
+    once per function by make_args_binder. For methods, build a binder with
+    is_method=True instead.
 
     Args:
-        sig: The function signature to validate against
-        exclude_self: If True, exclude 'self' parameter from extracted arguments
+        sig: The function signature to validate against, or the function itself
+            (preferred, as its binder is cached)
         args: Positional arguments to validate
         kwargs: Keyword arguments to validate
 
@@ -338,20 +372,38 @@ def validate_and_extract_args(
     Raises:
         TypeError: If arguments don't match the signature
     """
+    if isinstance(sig, inspect.Signature):
+        # Signatures are often built per call, leaving no stable key to cache a
+        # generated binder under, so bind them generically
+        return _extract_args(sig, False, args, kwargs)
+    # Binders consume the kwargs they are given
+    return _get_args_binder(sig)(args, dict(kwargs))
+
+
+def _extract_args(
+    sig: inspect.Signature,
+    is_method: bool,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    """Generic implementation of validate_and_extract_args using Signature.bind().
+
+    If is_method is True, args do not include the instance: a placeholder is
+    bound in its place and left out of the extracted arguments.
+    """
+    if is_method:
+        args = (None,) + args
+
     # Validate arguments using shared validation utility
     bound_args = validate_and_bind_signature(sig, *args, **kwargs)
 
     # Extract arguments
     args_dict = dict(bound_args.arguments)
-    if exclude_self:
-        args_dict.pop("self", None)
 
     # Separate back into positional and keyword arguments
     positional = []
     keyword = {}
     for param_name, param in sig.parameters.items():
-        if exclude_self and param_name == "self":
-            continue
         if param_name in args_dict:
             if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
                 positional.append(args_dict[param_name])
@@ -365,7 +417,239 @@ def validate_and_extract_args(
                 # KEYWORD_ONLY parameters
                 keyword[param_name] = args_dict[param_name]
 
-    return tuple(positional), keyword
+    # The instance is always bound first, so it is the first positional value
+    return tuple(positional[1:] if is_method else positional), keyword
+
+
+ArgsBinder = Callable[
+    [tuple[Any, ...], dict[str, Any]], tuple[tuple[Any, ...], dict[str, Any]]
+]
+
+
+# Binders built by validate_and_extract_args, cached per function like
+# _SIGNATURE_CACHE and dropped when the function is garbage collected
+_BINDER_CACHE: "WeakKeyDictionary[Callable[..., Any], ArgsBinder]" = WeakKeyDictionary()
+
+# Call shapes remembered per binder by _make_template_binder
+_TEMPLATE_CACHE_SIZE = 256
+
+
+def _get_args_binder(func: Callable[..., Any]) -> ArgsBinder:
+    """Return the cached binder for a function, building it on first use."""
+    try:
+        return _BINDER_CACHE[func]
+    except KeyError:
+        binder = _BINDER_CACHE[func] = make_args_binder(func)
+        return binder
+    except TypeError:
+        # Not weak-referenceable: bind generically rather than generate code per call
+        return functools.partial(_extract_args, get_signature(func), False)
+
+
+def _make_template_binder(sig: inspect.Signature, is_method: bool) -> ArgsBinder:
+    """Build a binder that caches how arguments map to parameters per call shape.
+
+    Whether a call binds, and where each argument ends up, only depends on the
+    number of positional arguments and the names of the keyword arguments. The
+    first call with a given shape is validated with Signature.bind(); later
+    calls with the same shape reuse the recorded mapping. At most
+    _TEMPLATE_CACHE_SIZE shapes are kept, as **kwargs names may vary freely.
+    """
+    # Each step is (source, key): an index into args, a name in kwargs, or a default
+    from_args, from_kwargs, from_default = 0, 1, 2
+    templates: dict[tuple[int, frozenset[str]], Any] = {}
+
+    params = list(sig.parameters.values())
+    all_positional = [
+        p
+        for p in sig.parameters.values()
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+    ]
+    named_keywords = frozenset(
+        p.name
+        for p in sig.parameters.values()
+        if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+    )
+    has_var_keyword = any(p.kind == p.VAR_KEYWORD for p in params)
+
+    def build_template(n_args: int, names: frozenset[str]) -> Any:
+        # Steps index into args as if the instance were passed as args[0]
+        n_args += is_method
+        positional_steps: list[tuple[int, Any]] = []
+        keyword_steps: list[tuple[str, int, Any]] = []
+        for param in params:
+            if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                index = all_positional.index(param)
+                if index < n_args:
+                    positional_steps.append((from_args, index))
+                elif param.kind == param.POSITIONAL_OR_KEYWORD and param.name in names:
+                    positional_steps.append((from_kwargs, param.name))
+                else:
+                    positional_steps.append((from_default, param.default))
+            elif param.kind == param.VAR_POSITIONAL:
+                positional_steps.extend(
+                    (from_args, i) for i in range(len(all_positional), n_args)
+                )
+            elif param.kind == param.KEYWORD_ONLY:
+                if param.name in names:
+                    keyword_steps.append((param.name, from_kwargs, param.name))
+                else:
+                    keyword_steps.append((param.name, from_default, param.default))
+        if is_method:
+            # Drop the instance, which is bound first, and shift the other indices
+            positional_steps = [
+                (source, key - 1 if source == from_args else key)
+                for source, key in positional_steps[1:]
+            ]
+        return tuple(positional_steps), tuple(keyword_steps)
+
+    def bind(
+        args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        key = (len(args), frozenset(kwargs))
+        template = templates.get(key)
+        if template is None:
+            # Validates the call, raising TypeError if it does not bind
+            result = _extract_args(sig, is_method, args, kwargs)
+            if len(templates) >= _TEMPLATE_CACHE_SIZE:
+                templates.clear()
+            templates[key] = build_template(*key)
+            return result
+
+        positional_steps, keyword_steps = template
+        positional = tuple(
+            args[key]
+            if source == from_args
+            else kwargs[key]
+            if source == from_kwargs
+            else key
+            for source, key in positional_steps
+        )
+        keyword = {
+            name: kwargs[key] if source == from_kwargs else key
+            for name, source, key in keyword_steps
+        }
+        if has_var_keyword:
+            keyword.update(
+                (name, value)
+                for name, value in kwargs.items()
+                if name not in named_keywords
+            )
+        return positional, keyword
+
+    return bind
+
+
+# Marks a required parameter that was not found in kwargs
+_MISSING = object()
+
+
+def _unexpected_keyword_error(kwargs: dict[str, Any]) -> TypeError:
+    """Build the TypeError for the first keyword argument left in kwargs."""
+    return TypeError(f"got an unexpected keyword argument {next(iter(kwargs))!r}")
+
+
+def make_args_binder(
+    sig: inspect.Signature | Callable[..., Any], is_method: bool = False
+) -> ArgsBinder:
+    """Build a function equivalent to validate_and_extract_args for a fixed signature.
+
+    The signature is inspected once and a specialised binder is generated with
+    the parameter names, positions and defaults baked in, so each call only does
+    a few index and dict lookups instead of Signature.bind(). Signatures using
+    positional-only parameters, *args or **kwargs instead get a binder that
+    caches the argument mapping per call shape.
+
+    Invalid calls raise the same TypeError messages as Signature.bind(); the
+    messages are prebuilt so the success path does no string formatting.
+
+    The binder pops the parameters it binds from the kwargs it is given, so
+    callers must pass a dict they own (such as a wrapper's **kwargs).
+
+    For methods, the binder takes the arguments without the instance, and the
+    first parameter is left out of the extracted arguments.
+
+    Args:
+        sig: The function signature to validate against, or the function itself
+        is_method: If True, the first parameter is the instance the method is
+            bound to, which is neither passed to nor returned by the binder
+
+    Returns:
+        A function taking (args, kwargs) and returning (positional_args, keyword_args)
+    """
+    if not isinstance(sig, inspect.Signature):
+        sig = get_signature(sig)
+    params = list(sig.parameters.values())
+    if any(
+        param.kind not in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+        for param in params
+    ):
+        return _make_template_binder(sig, is_method)
+    positional_params = [
+        (p.name, p.default) for p in params if p.kind == p.POSITIONAL_OR_KEYWORD
+    ]
+    keyword_params = [(p.name, p.default) for p in params if p.kind == p.KEYWORD_ONLY]
+
+    instance_name = None
+    if is_method:
+        if not positional_params:
+            # No parameter to bind the instance to: let Signature.bind() decide
+            return _make_template_binder(sig, is_method)
+        (instance_name, _), *positional_params = positional_params
+
+    namespace: dict[str, Any] = {
+        "_MISSING": _MISSING,
+        "_unexpected_keyword_error": _unexpected_keyword_error,
+    }
+
+    # Checks are emitted in the order Signature.bind() makes them, so the first
+    # error reported is the same. Messages are literals: nothing is formatted
+    # unless the call is invalid.
+    def bind_value(target: str, name: str, default: Any, indent: str) -> list[str]:
+        """Generate the lines popping a parameter's value from kwargs."""
+        if default is not inspect.Parameter.empty:
+            namespace[f"_default_{target}"] = default
+            return [f"{indent}{target} = kwargs.pop({name!r}, _default_{target})"]
+        message = f"missing a required argument: {name!r}"
+        return [
+            f"{indent}{target} = kwargs.pop({name!r}, _MISSING)",
+            f"{indent}if {target} is _MISSING:",
+            f"{indent}    raise TypeError({message!r})",
+        ]
+
+    body = [
+        "def _bind(args, kwargs):",
+        "    n = len(args)",
+    ]
+    if instance_name is not None:
+        message = f"multiple values for argument {instance_name!r}"
+        body.append(f"    if {instance_name!r} in kwargs:")
+        body.append(f"        raise TypeError({message!r})")
+    for i, (name, default) in enumerate(positional_params):
+        message = f"multiple values for argument {name!r}"
+        body.append(f"    if n > {i}:")
+        body.append(f"        p{i} = args[{i}]")
+        body.append(f"        if {name!r} in kwargs:")
+        body.append(f"            raise TypeError({message!r})")
+        body.append("    else:")
+        body.extend(bind_value(f"p{i}", name, default, " " * 8))
+    body.append(f"    if n > {len(positional_params)}:")
+    body.append("        raise TypeError('too many positional arguments')")
+    for i, (name, default) in enumerate(keyword_params):
+        body.extend(bind_value(f"k{i}", name, default, " " * 4))
+    # Every parameter has been popped, so anything left over is unexpected
+    body.append("    if kwargs:")
+    body.append("        raise _unexpected_keyword_error(kwargs)")
+
+    positional_values = "".join(f"p{i}, " for i in range(len(positional_params)))
+    keyword_values = ", ".join(
+        f"{name!r}: k{i}" for i, (name, _) in enumerate(keyword_params)
+    )
+    body.append(f"    return ({positional_values}), {{{keyword_values}}}")
+
+    exec("\n".join(body), namespace)
+    binder: ArgsBinder = namespace["_bind"]
+    return binder
 
 
 ###############################################################################
@@ -23,8 +23,9 @@ from designer_plugin.d3sdk.ast_utils import (
     filter_base_classes,
     filter_init_args,
     get_class_node,
+    get_signature,
     get_source,
-    validate_and_extract_args,
+    make_args_binder,
 )
 from designer_plugin.models import (
     D3_PLUGIN_DEFAULT_PORT,
@@ -81,7 +82,8 @@ def create_d3_plugin_method_wrapper(
     """Create a wrapper that executes a method remotely via Designer API calls.
 
     This wrapper intercepts method calls and instead of executing locally:
-    1. Validates arguments against the original method signature
+    1. Validates arguments against the original method signature (unless the
+       client's strict_signature_validation is False)
     2. Serializes the arguments using repr()
     3. Builds a script string in the form: "return plugin.{method_name}({args})"
     4. Creates a PluginPayload with the script and module information
@@ -94,20 +96,26 @@ def create_d3_plugin_method_wrapper(
 
     Returns:
         An async wrapper if the original method is async, otherwise a sync wrapper.
-        Both wrappers preserve the original method's metadata and signature validation.
+        Both wrappers preserve the original method's metadata (via functools.wraps,
+        plus a precomputed __signature__) and signature validation.
     """
-    # Get the signature for argument validation
-    sig = inspect.signature(original_method)
+    # Inspected once: the binder is generated from it, and it is exposed as
+    # __signature__ so inspect.signature() on the wrapper is a lookup
+    sig = get_signature(original_method)
+    # Build the argument validator once, rather than on every call
+    bind_args = make_args_binder(sig, is_method=True)
 
     # Determine whether to create async or sync wrapper based on original method
     if inspect.iscoroutinefunction(original_method):
         # Create async wrapper that uses async Designer API call
         @functools.wraps(original_method)
         async def async_wrapper(self, *args, **kwargs):  # type: ignore
-            positional, keyword = validate_and_extract_args(
-                sig, True, (self,) + args, kwargs
-            )
-            if not self.in_session():
+            if self.strict_signature_validation:
+                positional, keyword = bind_args(args, kwargs)
+            else:
+                positional, keyword = args, kwargs
+            # Inlined in_session() check, as this runs on every remote call
+            if not (self._hostname and self._port):
                 raise RuntimeError(
                     session_runtime_error_message(self.__class__.__name__)
                 )
@@ -117,15 +125,18 @@ def create_d3_plugin_method_wrapper(
             )
             return response.returnValue
 
+        async_wrapper.__signature__ = sig  # type: ignore[attr-defined]
         return async_wrapper
     else:
         # Create sync wrapper that uses synchronous Designer API call
         @functools.wraps(original_method)
         def sync_wrapper(self, *args, **kwargs):  # type: ignore
-            positional, keyword = validate_and_extract_args(
-                sig, True, (self,) + args, kwargs
-            )
-            if not self.in_session():
+            if self.strict_signature_validation:
+                positional, keyword = bind_args(args, kwargs)
+            else:
+                positional, keyword = args, kwargs
+            # Inlined in_session() check, as this runs on every remote call
+            if not (self._hostname and self._port):
                 raise RuntimeError(
                     session_runtime_error_message(self.__class__.__name__)
                 )
@@ -135,6 +146,7 @@ def create_d3_plugin_method_wrapper(
             )
             return response.returnValue
 
+        sync_wrapper.__signature__ = sig  # type: ignore[attr-defined]
         return sync_wrapper
 
 
@@ -162,8 +174,9 @@ def create_init_wrapper(original_init: Callable[..., Any]) -> Callable[..., None
     """Wrap user's __init__ to ensure parent initialisation is called.
 
     This ensures that even if the user forgets to call super().__init__(),
-    the required attributes (_hostname, _port, _override_module_name) are
-    still initialised, preventing AttributeError in methods like in_session().
+    the required attributes (_hostname, _port, _override_module_name,
+    _register_payloads) are still initialised, preventing AttributeError in
+    methods like in_session().
 
     Args:
         original_init: The user-defined __init__ method.
@@ -374,12 +387,21 @@ class D3PluginClient(metaclass=D3PluginClientMeta):
     ```
     Attributes:
         instance_code: The code used to instantiate the plugin remotely (set on init)
+        strict_signature_validation: Whether method calls are validated against
+            the method signatures before being sent to Designer (default True).
+            Set to False on the class or an instance to skip validation; invalid
+            calls then fail on the Designer side with a Python TypeError instead
+            of raising locally.
     """
 
+    strict_signature_validation: bool = True
+
     def __init__(self) -> None:
         self._hostname: str | None = None
         self._port: int | None = None
         self._override_module_name: str | None = None
+        # Registration payloads by module name, built on first registration
+        self._register_payloads: dict[str, RegisterPayload] = {}
 
     def in_session(self) -> bool:
         """Check if the client is currently in an active session.
@@ -507,10 +529,18 @@ class D3PluginClient(metaclass=D3PluginClientMeta):
     def _get_register_module_payload(self) -> RegisterPayload:
         """Build the module registration payload for Designer.
 
+        The module contents are fixed once the instance is created, so the
+        payload is built and validated once per module name. Each call returns
+        a copy of it, so callers cannot alter the payload later sessions send.
+
         Returns:
             RegisterPayload containing moduleName and contents for registration.
         """
-        return RegisterPayload(
-            moduleName=self._get_module_name(),
-            contents=self._get_register_module_content(),
-        )
+        module_name = self._get_module_name()
+        payload = self._register_payloads.get(module_name)
+        if payload is None:
+            payload = self._register_payloads[module_name] = RegisterPayload(
+                moduleName=module_name,
+                contents=self._get_register_module_content(),
+            )
+        return payload.model_copy()
@@ -16,6 +16,7 @@ from pydantic import BaseModel, Field
 from designer_plugin.d3sdk.ast_utils import (
     convert_function_to_py27,
     find_packages_in_current_file,
+    get_signature,
     validate_and_bind_signature,
     validate_and_extract_args,
 )
@@ -100,7 +101,7 @@ def extract_function_info(func: Callable[..., Any]) -> FunctionInfo:
         body += ast.unparse(stmt) + "\n"
 
     # Extract function arguments
-    sig: inspect.Signature = inspect.signature(func)
+    sig: inspect.Signature = get_signature(func)
     args: list[str] = list(sig.parameters.keys())
 
     first_node_py27 = convert_function_to_py27(first_node)
@@ -145,7 +146,7 @@ class D3PythonScript(Generic[P, T]):
         Returns:
             The signature of the wrapped function for IDE support.
         """
-        return inspect.signature(self._function)
+        return get_signature(self._function)
 
     @property
     def function_info(self) -> FunctionInfo:
@@ -192,8 +193,10 @@ class D3PythonScript(Generic[P, T]):
         Raises:
             TypeError: If arguments don't match the function signature.
         """
-        sig: inspect.Signature = inspect.signature(self._function)
-        positional, keyword_args = validate_and_extract_args(sig, False, args, kwargs)
+        sig: inspect.Signature = get_signature(self._function)
+        positional, keyword_args = validate_and_extract_args(
+            self._function, args, kwargs
+        )
 
         # Create assignment strings for positional arguments using parameter names from signature
         param_names = list(sig.parameters.keys())
@@ -334,7 +337,7 @@ class D3Function(D3PythonScript[P, T]):
             TypeError: If arguments don't match the function signature.
         """
         # Validate arguments against signature using shared utility
-        sig = inspect.signature(self._function)
+        sig = get_signature(self._function)
         validate_and_bind_signature(
             sig, *args, **kwargs
         )  # This validates and raises TypeError if invalid
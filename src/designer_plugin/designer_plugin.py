@@ -4,11 +4,202 @@ Copyright (c) 2025 Disguise Technologies ltd
 """
 
 import asyncio
+import json
+import marshal
+import os
 import socket
-from json import load as json_load
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from functools import cached_property, lru_cache
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from weakref import WeakKeyDictionary
 
-from zeroconf import ServiceInfo, Zeroconf
-from zeroconf.asyncio import AsyncZeroconf
+# zeroconf is imported where it is used so that importing designer_plugin
+# (e.g. for the d3sdk client) does not pay for loading the mDNS stack.
+if TYPE_CHECKING:
+    from zeroconf import ServiceInfo, Zeroconf
+    from zeroconf.asyncio import AsyncZeroconf
+
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+
+T = TypeVar("T")
+
+# Sidecar file holding a pre-parsed copy of a plugin options file
+OPTIONS_CACHE_SUFFIX = ".cache"
+
+
+def _load_options(file_path: str) -> dict[str, Any]:
+    """Read and parse a plugin options JSON file."""
+    with open(file_path, "rb") as f:
+        options: dict[str, Any] = _json_loads(f.read())
+    return options
+
+
+# Identifies a version of an options file: (st_ino, st_size, st_mtime_ns, st_ctime_ns)
+OptionsStamp = tuple[int, int, int, int]
+
+
+def _read_options_cache(cache_path: str, stamp: OptionsStamp) -> dict[str, Any] | None:
+    """Load pre-parsed options from a sidecar cache file.
+
+    Returns:
+        The cached options, or None if the cache is missing, unreadable or
+        was written for a different version of the options file.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, options = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if cached_stamp != stamp or not isinstance(options, dict):
+        return None
+    return options
+
+
+def _write_options_cache(
+    cache_path: str, stamp: OptionsStamp, options: dict[str, Any]
+) -> None:
+    """Atomically write parsed options to a sidecar cache file.
+
+    The cache is best-effort: failures (e.g. a read-only directory) are ignored.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            marshal.dump((stamp, options), f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError):
+        with suppress(OSError):
+            os.remove(tmp_path)
+
+
+@lru_cache(maxsize=16)
+def _load_options_cached(abs_path: str, stamp: OptionsStamp) -> dict[str, Any]:
+    """Parse a plugin options file, memoized on its path and stat stamp.
+
+    Across processes, the parsed options are shared through a sidecar file
+    next to the options file, which is used as long as the options file is
+    unchanged. The inode and change time are part of the stamp, so a file
+    replaced or rewritten within one modification time tick is still noticed.
+    """
+    cache_path = abs_path + OPTIONS_CACHE_SUFFIX
+    options = _read_options_cache(cache_path, stamp)
+    if options is None:
+        options = _load_options(abs_path)
+        _write_options_cache(cache_path, stamp, options)
+    return options
+
+
+def _read_options(file_path: str) -> dict[str, Any]:
+    """Return the parsed options of a plugin options file.
+
+    Repeated reads of an unchanged file are served from memory. The returned
+    dict is shared between callers and must not be mutated.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        # Let open() raise the appropriate error for the file
+        return _load_options(file_path)
+    stamp = (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+    return _load_options_cached(os.path.abspath(file_path), stamp)
+
+
+class _SharedInstance(Generic[T]):
+    """A lazily created, reference-counted instance shared by all plugins.
+
+    Publishing several plugins from one process reuses a single mDNS stack
+    (multicast sockets and listener threads) instead of starting one per plugin.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._lock = Lock()
+        self._instance: T | None = None
+        self._refcount = 0
+
+    def acquire(self) -> T:
+        """Return the shared instance, creating it on first use."""
+        with self._lock:
+            if self._instance is None:
+                self._instance = self._factory()
+            self._refcount += 1
+            return self._instance
+
+    def release(self) -> T | None:
+        """Drop a reference to the shared instance.
+
+        Returns:
+            The instance if this was the last reference, in which case the
+            caller is responsible for closing it. None otherwise.
+        """
+        with self._lock:
+            self._refcount -= 1
+            if self._refcount > 0:
+                return None
+            instance, self._instance = self._instance, None
+            return instance
+
+
+# The machine's hostname, advertised when a plugin does not specify one.
+# Looked up once rather than on every DesignerPlugin construction.
+_default_hostname: str = socket.gethostname()
+
+
+def refresh_default_hostname() -> str:
+    """Re-read the machine's hostname used when a plugin does not specify one.
+
+    Returns:
+        The new default hostname.
+    """
+    global _default_hostname
+    _default_hostname = socket.gethostname()
+    return _default_hostname
+
+
+def _create_zeroconf() -> "Zeroconf":
+    from zeroconf import Zeroconf
+
+    return Zeroconf()
+
+
+def _create_azeroconf() -> "AsyncZeroconf":
+    from zeroconf.asyncio import AsyncZeroconf
+
+    return AsyncZeroconf()
+
+
+_shared_zeroconf: "_SharedInstance[Zeroconf]" = _SharedInstance(_create_zeroconf)
+
+# An AsyncZeroconf is bound to the event loop it was created on, so plugins
+# only share one with other plugins running on the same loop
+_shared_azeroconfs = WeakKeyDictionary[
+    asyncio.AbstractEventLoop, "_SharedInstance[AsyncZeroconf]"
+]()
+_shared_azeroconfs_lock = Lock()
+
+
+def _get_shared_azeroconf() -> "_SharedInstance[AsyncZeroconf]":
+    """Return the shared AsyncZeroconf holder for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _shared_azeroconfs_lock:
+        shared = _shared_azeroconfs.get(loop)
+        if shared is None:
+            shared = _shared_azeroconfs[loop] = _SharedInstance(_create_azeroconf)
+        return shared
+
+
+# DesignerPlugin attributes the cached ServiceInfo is built from
+_SERVICE_INFO_FIELDS = frozenset(
+    {"name", "port", "hostname", "custom_url", "requires_session", "is_disguise"}
+)
 
 
 class DesignerPlugin:
@@ -25,14 +216,17 @@ class DesignerPlugin:
     ):
         self.name = name
         self.port = port
-        self.hostname = hostname or socket.gethostname()
-        self.custom_url = url
-        self.url = url or f"http://{self.hostname}:{port}"
+        self.hostname = hostname or _default_hostname
         self.requires_session = requires_session
         self.is_disguise = is_disguise
+        self.set_url(url)
 
         self._zeroconf: Zeroconf | None = None
         self._azeroconf: AsyncZeroconf | None = None
+        # The ServiceInfo currently published, unregistered as is on exit even if
+        # the attributes it was built from have changed since
+        self._registration: ServiceInfo | None = None
+        self._register_task: asyncio.Task[Any] | None = None
 
     @staticmethod
     def default_init(port: int, hostname: str | None = None) -> "DesignerPlugin":
@@ -46,20 +240,45 @@ class DesignerPlugin:
         file_path: str, port: int, hostname: str | None = None
     ) -> "DesignerPlugin":
         """Convert a JSON file (expected d3plugin.json) to PluginOptions. hostname and port are required."""
-        with open(file_path) as f:
-            options = json_load(f)
-            return DesignerPlugin(
-                name=options["name"],
-                port=port,
-                hostname=hostname,
-                url=options.get("url", None),
-                requires_session=options.get("requiresSession", False),
-                is_disguise=options.get("isDisguise", False),
-            )
+        options = _read_options(file_path)
+        return DesignerPlugin(
+            name=options["name"],
+            port=port,
+            hostname=hostname,
+            url=options.get("url", None),
+            requires_session=options.get("requiresSession", False),
+            is_disguise=options.get("isDisguise", False),
+        )
+
+    def set_url(self, url: str | None) -> None:
+        """Set the URL Designer uses to open the plugin's web UI.
+
+        Args:
+            url: The URL to advertise, or None to use the plugin's hostname and port.
+        """
+        self.custom_url = url
+        self.url = url or f"http://{self.hostname}:{self.port}"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _SERVICE_INFO_FIELDS:
+            # Rebuild the ServiceInfo on next access
+            self.__dict__.pop("service_info", None)
+
+    @cached_property
+    def service_info(self) -> "ServiceInfo":
+        """Convert the options to a dictionary suitable for DNS-SD service properties.
+
+        The ServiceInfo is built once on first access and reused for every
+        subsequent registration of this plugin, until one of the attributes it
+        is built from is changed.
+        """
+        return self._build_service_info()
+
+    def _build_service_info(self) -> "ServiceInfo":
+        """Build the DNS-SD ServiceInfo describing this plugin."""
+        from zeroconf import ServiceInfo
 
-    @property
-    def service_info(self) -> ServiceInfo:
-        """Convert the options to a dictionary suitable for DNS-SD service properties."""
         properties = {
             b"t": b"web",
             b"s": b"true" if self.requires_session else b"false",
@@ -77,21 +296,88 @@ class DesignerPlugin:
         )
 
     def __enter__(self) -> "DesignerPlugin":
-        self._zeroconf = Zeroconf()
-        self._zeroconf.register_service(self.service_info)
+        self._zeroconf = _shared_zeroconf.acquire()
+        registration = self.service_info
+        try:
+            self._zeroconf.register_service(registration)
+        except BaseException:
+            self._release_zeroconf()
+            raise
+        self._registration = registration
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):  # type: ignore
         if self._zeroconf:
-            self._zeroconf.close()
-            self._zeroconf = None
+            try:
+                if self._registration:
+                    self._zeroconf.unregister_service(self._registration)
+            finally:
+                self._release_zeroconf()
+
+    def _release_zeroconf(self) -> None:
+        """Release the shared Zeroconf instance, closing it if no plugin uses it."""
+        self._registration = None
+        self._zeroconf = None
+        zeroconf = _shared_zeroconf.release()
+        if zeroconf:
+            zeroconf.close()
+
+    @staticmethod
+    async def async_register_many(
+        plugins: Iterable["DesignerPlugin"],
+    ) -> "AsyncZeroconf":
+        """Publish several plugins concurrently on a single AsyncZeroconf instance.
+
+        The DNS-SD probe for every plugin runs at the same time, so the probe
+        wait is paid once for the whole batch rather than once per plugin.
+
+        Args:
+            plugins: The plugins to publish.
+
+        Returns:
+            The AsyncZeroconf instance the plugins are published on. The caller
+            owns it and must call async_close() on it to unpublish the plugins.
+        """
+        azeroconf = _create_azeroconf()
+        try:
+            announcements = await asyncio.gather(
+                *(
+                    azeroconf.async_register_service(plugin.service_info)
+                    for plugin in plugins
+                )
+            )
+            # Registration returns once probing is done; wait for the announcements too
+            await asyncio.gather(*announcements)
+        except BaseException:
+            await azeroconf.async_close()
+            raise
+        return azeroconf
 
     async def __aenter__(self) -> "DesignerPlugin":
-        self._azeroconf = AsyncZeroconf()
-        asyncio.create_task(self._azeroconf.async_register_service(self.service_info))
+        self._azeroconf = _get_shared_azeroconf().acquire()
+        # Registration (including the DNS-SD probe) runs in the background;
+        # keep a reference so it is not garbage collected and can be awaited on exit.
+        self._registration = self.service_info
+        self._register_task = asyncio.create_task(
+            self._azeroconf.async_register_service(self._registration)
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):  # type: ignore
-        if self._azeroconf:
-            await self._azeroconf.async_close()
+        if not self._azeroconf:
+            return
+        try:
+            if self._register_task and self._registration:
+                # Wait for the announcements as well, so none goes out after the goodbye
+                await (await self._register_task)
+                # Wait for the goodbye broadcast so it is not cut short by a close
+                await (
+                    await self._azeroconf.async_unregister_service(self._registration)
+                )
+        finally:
+            self._register_task = None
+            self._registration = None
             self._azeroconf = None
+            azeroconf = _get_shared_azeroconf().release()
+            if azeroconf:
+                await azeroconf.async_close()
@@ -22,6 +22,14 @@ Module-level loggers should be created using standard Python logging:
     import logging
     logger = logging.getLogger(__name__)
 
+Pass values as %-style arguments rather than pre-formatting them with
+f-strings, so formatting only happens when the record is emitted. Guard
+debug logs whose arguments are expensive to compute (e.g. debug_string())
+so they are skipped entirely when DEBUG is disabled:
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Send plugin api:%s", payload.debug_string())
+
 Advanced Usage - Granular Control:
 
 This library uses module-level loggers, allowing you to control logging
@@ -18,6 +18,7 @@ from designer_plugin.d3sdk.ast_utils import (
     filter_init_args,
     find_packages_in_current_file,
     get_class_node,
+    get_signature,
     get_source,
 )
 
@@ -1025,6 +1026,35 @@ class TestDecoratorHandling:
         assert method.returns is None
 
 
+class TestGetSignature:
+    """Tests for the cached get_signature helper."""
+
+    def test_matches_inspect_signature(self):
+        """Test that the cached signature equals inspect.signature."""
+        def func(a: int, b: str = "x", *, c: float) -> None:
+            pass
+
+        assert get_signature(func) == inspect.signature(func)
+
+    def test_signature_computed_once(self):
+        """Test that repeated lookups reuse the same Signature object."""
+        def func(a, b):
+            pass
+
+        assert get_signature(func) is get_signature(func)
+
+    def test_callable_without_weakref(self):
+        """Test that callables which cannot be weakly referenced still work."""
+        class Callable:
+            __slots__ = ()
+
+            def __call__(self, a, b=1):
+                pass
+
+        func = Callable()
+        assert get_signature(func) == inspect.signature(func)
+
+
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
 
@@ -60,6 +60,20 @@ class TestSignatureValidation:
             returnValue=42
         )
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def patched_api(cls):
+        """Patch d3_api_plugin once for all tests in the class."""
+        with patch('designer_plugin.d3sdk.client.d3_api_plugin') as mock_api:
+            yield mock_api
+
+    @pytest.fixture
+    def mock_api(self, patched_api, mock_response):
+        """The patched d3_api_plugin, reset to return mock_response."""
+        patched_api.reset_mock()
+        patched_api.return_value = mock_response
+        return patched_api
+
     def test_method_call_without_session_raises_error(self, plugin):
         """Test that calling a method outside of a session raises RuntimeError."""
         # Verify plugin is not in session
@@ -69,16 +83,15 @@ class TestSignatureValidation:
         with pytest.raises(RuntimeError, match="is not in.*session"):
             plugin.simple_method(1, 2)
 
-    def test_correct_arguments_sync(self, plugin, mock_response):
+    def test_correct_arguments_sync(self, plugin, mock_api):
         """Test that correct arguments pass through successfully."""
-        with patch('designer_plugin.d3sdk.client.d3_api_plugin', return_value=mock_response) as mock_api:
-            plugin._hostname = "localhost"
-            plugin._port = 80
+        plugin._hostname = "localhost"
+        plugin._port = 80
 
-            result = plugin.simple_method(5, 10)
+        result = plugin.simple_method(5, 10)
 
-            assert result == 42
-            mock_api.assert_called_once()
+        assert result == 42
+        mock_api.assert_called_once()
 
     def test_too_many_positional_arguments(self, plugin):
         """Test that too many positional arguments raise TypeError."""
@@ -112,45 +125,41 @@ class TestSignatureValidation:
         with pytest.raises(TypeError, match="got an unexpected keyword argument"):
             plugin.simple_method(1, 2, unexpected=3)
 
-    def test_method_with_defaults_partial_args(self, plugin, mock_response):
+    def test_method_with_defaults_partial_args(self, plugin, mock_api):
         """Test method with default parameters using partial arguments."""
-        with patch('designer_plugin.d3sdk.client.d3_api_plugin', return_value=mock_response):
-            plugin._hostname = "localhost"
-            plugin._port = 80
+        plugin._hostname = "localhost"
+        plugin._port = 80
 
-            # Should work with just required argument
-            result = plugin.method_with_defaults(5)
-            assert result == 42
+        # Should work with just required argument
+        result = plugin.method_with_defaults(5)
+        assert result == 42
 
-    def test_method_with_defaults_override(self, plugin, mock_response):
+    def test_method_with_defaults_override(self, plugin, mock_api):
         """Test method with default parameters overriding defaults."""
-        with patch('designer_plugin.d3sdk.client.d3_api_plugin', return_value=mock_response):
-            plugin._hostname = "localhost"
-            plugin._port = 80
+        plugin._hostname = "localhost"
+        plugin._port = 80
 
-            # Should work with overriding defaults
-            result = plugin.method_with_defaults(5, 15, 25)
-            assert result == 42
+        # Should work with overriding defaults
+        result = plugin.method_with_defaults(5, 15, 25)
+        assert result == 42
 
-    def test_method_with_defaults_keyword(self, plugin, mock_response):
+    def test_method_with_defaults_keyword(self, plugin, mock_api):
         """Test method with default parameters using keyword arguments."""
-        with patch('designer_plugin.d3sdk.client.d3_api_plugin', return_value=mock_response):
-            plugin._hostname = "localhost"
-            plugin._port = 80
+        plugin._hostname = "localhost"
+        plugin._port = 80
 
-            # Should work with keyword arguments
-            result = plugin.method_with_defaults(5, z=30)
-            assert result == 42
+        # Should work with keyword arguments
+        result = plugin.method_with_defaults(5, z=30)
+        assert result == 42
 
-    def test_keyword_only_parameters(self, plugin, mock_response):
+    def test_keyword_only_parameters(self, plugin, mock_api):
         """Test method with keyword-only parameters."""
-        with patch('designer_plugin.d3sdk.client.d3_api_plugin', return_value=mock_response):
-            plugin._hostname = "localhost"
-            plugin._port = 80
+        plugin._hostname = "localhost"
+        plugin._port = 80
 
-            # Should work with keyword arguments
-            result = plugin.method_keyword_only(name="test", value=100)
-            assert result == 42
+        # Should work with keyword arguments
+        result = plugin.method_keyword_only(name="test", value=100)
+        assert result == 42
 
     def test_keyword_only_parameters_as_positional_fails(self, plugin):
         """Test that keyword-only parameters cannot be passed as positional."""
@@ -160,14 +169,13 @@ class TestSignatureValidation:
         with pytest.raises(TypeError, match="too many positional arguments"):
             plugin.method_keyword_only("test", 100)
 
-    def test_mixed_parameters(self, plugin, mock_response):
+    def test_mixed_parameters(self, plugin, mock_api):
         """Test method with mixed parameter types."""
-        with patch('designer_plugin.d3sdk.client.d3_api_plugin', return_value=mock_response):
-            plugin._hostname = "localhost"
-            plugin._port = 80
+        plugin._hostname = "localhost"
+        plugin._port = 80
 
-            result = plugin.method_mixed(1, 2, c="test")
-            assert result == 42
+        result = plugin.method_mixed(1, 2, c="test")
+        assert result == 42
 
     def test_mixed_parameters_missing_keyword_only(self, plugin):
         """Test that missing keyword-only parameter raises TypeError."""
@@ -177,6 +185,37 @@ class TestSignatureValidation:
         with pytest.raises(TypeError, match="missing a required*"):
             plugin.method_mixed(1, 2)
 
+    def test_signature_validation_disabled(self, plugin, mock_api):
+        """Test that disabling strict validation forwards arguments unchecked."""
+        plugin._hostname = "localhost"
+        plugin._port = 80
+        plugin.strict_signature_validation = False
+
+        # Would raise "too many positional arguments" with validation enabled
+        result = plugin.simple_method(1, 2, 3)
+
+        assert result == 42
+        payload = mock_api.call_args.args[2]
+        assert payload.script == "return plugin.simple_method(1, 2, 3)"
+
+    def test_no_introspection_on_call_path(self, plugin, mock_api, mock_response):
+        """Test that wrapped calls do no inspect work; it all happens at class creation."""
+        import asyncio
+
+        plugin._hostname = "localhost"
+        plugin._port = 80
+        with (
+            patch('designer_plugin.d3sdk.client.d3_api_aplugin', AsyncMock(return_value=mock_response)),
+            patch('inspect.signature') as mock_signature,
+            patch('inspect.iscoroutinefunction') as mock_iscoroutinefunction,
+        ):
+            assert plugin.method_with_defaults(5, z=30) == 42
+            assert plugin.method_mixed(1, c="test") == 42
+            assert asyncio.run(plugin.async_method(2, 3)) == 42
+
+            mock_signature.assert_not_called()
+            mock_iscoroutinefunction.assert_not_called()
+
     def test_async_method_signature_validation(self, plugin):
         """Test that async methods have signature validation (check without running)."""
         import inspect
@@ -187,6 +226,27 @@ class TestSignatureValidation:
         # The wrapper should preserve the function metadata
         assert plugin.async_method.__name__ == "async_method"
 
+    def test_wrapper_exposes_cached_signature(self):
+        """Test that wrappers carry the original signature without re-inspection."""
+        import inspect
+        from designer_plugin.d3sdk.ast_utils import get_signature
+
+        for name in ("simple_method", "method_mixed", "async_method"):
+            wrapper = getattr(SignatureValidationPlugin, name)
+            sig = get_signature(wrapper.__wrapped__)
+            assert wrapper.__signature__ is sig
+            assert inspect.signature(wrapper) is sig
+
+    def test_methods_wrapped_once_per_class(self):
+        """Test that instances share the class's wrappers instead of re-wrapping."""
+        with patch('designer_plugin.d3sdk.client.create_d3_plugin_method_wrapper') as mock_wrap:
+            first = SignatureValidationPlugin("first")
+            second = SignatureValidationPlugin("second")
+            mock_wrap.assert_not_called()
+
+        assert first.simple_method.__func__ is second.simple_method.__func__
+        assert first.simple_method.__func__ is SignatureValidationPlugin.simple_method
+
 
 class TestValidateAndExtractArgs:
     """Test suite for validate_and_extract_args helper function."""
@@ -196,11 +256,11 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, b, c):
+        def test_func(a, b, c):
             pass
 
         sig = inspect.signature(test_func)
-        positional, keyword = validate_and_extract_args(sig, True, (None, 1, 2, 3), {})
+        positional, keyword = validate_and_extract_args(sig, (1, 2, 3), {})
 
         assert positional == (1, 2, 3)
         assert keyword == {}
@@ -210,11 +270,11 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, *, a, b):
+        def test_func(*, a, b):
             pass
 
         sig = inspect.signature(test_func)
-        positional, keyword = validate_and_extract_args(sig, True, (None,), {'a': 1, 'b': 2})
+        positional, keyword = validate_and_extract_args(sig, (), {'a': 1, 'b': 2})
 
         assert positional == ()
         assert keyword == {'a': 1, 'b': 2}
@@ -224,11 +284,11 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, b=5, *, c):
+        def test_func(a, b=5, *, c):
             pass
 
         sig = inspect.signature(test_func)
-        positional, keyword = validate_and_extract_args(sig, True, (None, 1), {'b': 10, 'c': 'test'})
+        positional, keyword = validate_and_extract_args(sig, (1,), {'b': 10, 'c': 'test'})
 
         assert positional == (1, 10)
         assert keyword == {'c': 'test'}
@@ -238,11 +298,11 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, b=10, c=20):
+        def test_func(a, b=10, c=20):
             pass
 
         sig = inspect.signature(test_func)
-        positional, keyword = validate_and_extract_args(sig, True, (None, 1), {})
+        positional, keyword = validate_and_extract_args(sig, (1,), {})
 
         # Should include defaults
         assert positional == (1, 10, 20)
@@ -253,24 +313,24 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, b):
+        def test_func(a, b):
             pass
 
         sig = inspect.signature(test_func)
 
         with pytest.raises(TypeError):
-            validate_and_extract_args(sig, True, (None, 1, 2, 3), {})
+            validate_and_extract_args(sig, (1, 2, 3), {})
 
     def test_var_positional_args_extraction(self):
         """Test that *args are correctly unpacked into positional arguments."""
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, b, *args):
+        def test_func(a, b, *args):
             pass
 
         sig = inspect.signature(test_func)
-        positional, keyword = validate_and_extract_args(sig, True, (None, 1, 2, 3, 4, 5), {})
+        positional, keyword = validate_and_extract_args(sig, (1, 2, 3, 4, 5), {})
 
         assert positional == (1, 2, 3, 4, 5)
         assert keyword == {}
@@ -280,11 +340,11 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, b, *args):
+        def test_func(a, b, *args):
             pass
 
         sig = inspect.signature(test_func)
-        positional, keyword = validate_and_extract_args(sig, True, (None, 1, 2), {})
+        positional, keyword = validate_and_extract_args(sig, (1, 2), {})
 
         assert positional == (1, 2)
         assert keyword == {}
@@ -294,12 +354,12 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, **kwargs):
+        def test_func(a, **kwargs):
             pass
 
         sig = inspect.signature(test_func)
         positional, keyword = validate_and_extract_args(
-            sig, True, (None, 1), {'x': 10, 'y': 20, 'z': 30}
+            sig, (1,), {'x': 10, 'y': 20, 'z': 30}
         )
 
         assert positional == (1,)
@@ -310,11 +370,11 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, **kwargs):
+        def test_func(a, **kwargs):
             pass
 
         sig = inspect.signature(test_func)
-        positional, keyword = validate_and_extract_args(sig, True, (None, 1), {})
+        positional, keyword = validate_and_extract_args(sig, (1,), {})
 
         assert positional == (1,)
         assert keyword == {}
@@ -324,12 +384,12 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, b, *args, **kwargs):
+        def test_func(a, b, *args, **kwargs):
             pass
 
         sig = inspect.signature(test_func)
         positional, keyword = validate_and_extract_args(
-            sig, True, (None, 1, 2, 3, 4), {'x': 10, 'y': 20}
+            sig, (1, 2, 3, 4), {'x': 10, 'y': 20}
         )
 
         assert positional == (1, 2, 3, 4)
@@ -340,12 +400,12 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, b, *args, c, d=10, **kwargs):
+        def test_func(a, b, *args, c, d=10, **kwargs):
             pass
 
         sig = inspect.signature(test_func)
         positional, keyword = validate_and_extract_args(
-            sig, True, (None, 1, 2, 3, 4), {'c': 5, 'd': 15, 'x': 100, 'y': 200}
+            sig, (1, 2, 3, 4), {'c': 5, 'd': 15, 'x': 100, 'y': 200}
         )
 
         # Positional should include a, b, and *args
@@ -358,11 +418,11 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, b, /, *args):
+        def test_func(a, b, /, *args):
             pass
 
         sig = inspect.signature(test_func)
-        positional, keyword = validate_and_extract_args(sig, True, (None, 1, 2, 3, 4, 5), {})
+        positional, keyword = validate_and_extract_args(sig, (1, 2, 3, 4, 5), {})
 
         assert positional == (1, 2, 3, 4, 5)
         assert keyword == {}
@@ -372,12 +432,12 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, *args):
+        def test_func(*args):
             pass
 
         sig = inspect.signature(test_func)
         positional, keyword = validate_and_extract_args(
-            sig, True, (None, 'a', 'b', 'c', 'd', 'e'), {}
+            sig, ('a', 'b', 'c', 'd', 'e'), {}
         )
 
         assert positional == ('a', 'b', 'c', 'd', 'e')
@@ -388,17 +448,228 @@ class TestValidateAndExtractArgs:
         from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
         import inspect
 
-        def test_func(self, a, *, b, c, **kwargs):
+        def test_func(a, *, b, c, **kwargs):
             pass
 
         sig = inspect.signature(test_func)
         positional, keyword = validate_and_extract_args(
-            sig, True, (None, 1), {'b': 2, 'c': 3, 'x': 10, 'y': 20}
+            sig, (1,), {'b': 2, 'c': 3, 'x': 10, 'y': 20}
         )
 
         assert positional == (1,)
         assert keyword == {'b': 2, 'c': 3, 'x': 10, 'y': 20}
 
+    def test_function_instead_of_signature(self):
+        """Test that the function itself can be passed instead of its signature."""
+        from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
+
+        def test_func(a, b=10, *, c):
+            pass
+
+        positional, keyword = validate_and_extract_args(test_func, (1,), {'c': 3})
+
+        assert positional == (1, 10)
+        assert keyword == {'c': 3}
+
+    def test_caller_kwargs_not_modified(self):
+        """Test that the caller's kwargs dict is left untouched."""
+        from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
+
+        def test_func(a, b=10, *, c):
+            pass
+
+        kwargs = {'b': 2, 'c': 3}
+        validate_and_extract_args(test_func, (1,), kwargs)
+
+        assert kwargs == {'b': 2, 'c': 3}
+
+
+class TestMakeArgsBinder:
+    """Test suite for the specialised binder generated by make_args_binder."""
+
+    def test_matches_validate_and_extract_args(self):
+        """Test that the generated binder extracts the same arguments as Signature.bind()."""
+        from designer_plugin.d3sdk.ast_utils import _extract_args, make_args_binder
+        import inspect
+
+        def test_func(self, a, b=5, *, c, d=10):
+            pass
+
+        sig = inspect.signature(test_func)
+        bind = make_args_binder(sig, is_method=True)
+        calls = [
+            ((1,), {'c': 'test'}),
+            ((1, 2), {'c': 'test', 'd': 20}),
+            ((), {'a': 1, 'b': 2, 'c': 'test'}),
+        ]
+        for args, kwargs in calls:
+            assert bind(args, dict(kwargs)) == _extract_args(sig, True, args, kwargs)
+
+    def test_defaults_applied(self):
+        """Test that defaults are filled in by the generated binder."""
+        from designer_plugin.d3sdk.ast_utils import make_args_binder
+        import inspect
+
+        def test_func(self, a, b=10, c=20):
+            pass
+
+        bind = make_args_binder(inspect.signature(test_func), is_method=True)
+        assert bind((1,), {'c': 30}) == ((1, 10, 30), {})
+
+    def test_invalid_arguments_raise_type_error(self):
+        """Test that invalid calls raise the standard TypeError messages."""
+        from designer_plugin.d3sdk.ast_utils import make_args_binder
+        import inspect
+
+        def test_func(self, a, b):
+            pass
+
+        bind = make_args_binder(inspect.signature(test_func), is_method=True)
+        with pytest.raises(TypeError, match="too many positional arguments"):
+            bind((1, 2, 3), {})
+        with pytest.raises(TypeError, match="multiple values for argument"):
+            bind((1,), {'a': 2})
+        with pytest.raises(TypeError, match="missing a required argument"):
+            bind((1,), {})
+        with pytest.raises(TypeError, match="got an unexpected keyword argument"):
+            bind((1, 2), {'unexpected': 3})
+
+    def test_method_binder_excludes_instance(self):
+        """Test that method binders take and return arguments without the instance."""
+        from designer_plugin.d3sdk.ast_utils import make_args_binder
+
+        def test_func(self, a, b=2):
+            pass
+
+        bind = make_args_binder(test_func, is_method=True)
+        assert bind((1,), {}) == ((1, 2), {})
+        with pytest.raises(TypeError, match="too many positional arguments"):
+            bind((1, 2, 3), {})
+        with pytest.raises(TypeError, match="multiple values for argument 'self'"):
+            bind((1,), {'self': None})
+
+    def test_invalid_arguments_do_not_use_signature_bind(self):
+        """Test that invalid calls raise prebuilt errors without Signature.bind()."""
+        from designer_plugin.d3sdk.ast_utils import make_args_binder
+        import inspect
+
+        def test_func(self, a, *, b):
+            pass
+
+        bind = make_args_binder(inspect.signature(test_func), is_method=True)
+        with patch.object(inspect.Signature, 'bind') as mock_bind:
+            with pytest.raises(TypeError, match="missing a required argument: 'b'"):
+                bind((1,), {})
+            with pytest.raises(TypeError, match="unexpected keyword argument 'd'"):
+                bind((1,), {'b': 2, 'd': 3, 'c': 4})
+        mock_bind.assert_not_called()
+
+    def test_var_arguments_use_generic_path(self):
+        """Test that signatures with *args/**kwargs are still handled."""
+        from designer_plugin.d3sdk.ast_utils import make_args_binder
+        import inspect
+
+        def test_func(self, a, b, /, *args, c, **kwargs):
+            pass
+
+        bind = make_args_binder(inspect.signature(test_func), is_method=True)
+        assert bind((1, 2, 3), {'c': 4, 'x': 5}) == ((1, 2, 3), {'c': 4, 'x': 5})
+
+    def test_var_arguments_same_call_shape_reused(self):
+        """Test that repeated calls with the same shape bind their own values."""
+        from designer_plugin.d3sdk.ast_utils import make_args_binder
+        import inspect
+
+        def test_func(self, a, /, *args, b=2, **kwargs):
+            pass
+
+        bind = make_args_binder(inspect.signature(test_func), is_method=True)
+        assert bind((1, 2), {'x': 3}) == ((1, 2), {'b': 2, 'x': 3})
+        assert bind((4, 5), {'x': 6}) == ((4, 5), {'b': 2, 'x': 6})
+        with pytest.raises(TypeError, match="missing a required argument"):
+            bind((), {})
+        with pytest.raises(TypeError, match="missing a required argument"):
+            bind((), {})
+
+    def test_validate_and_extract_args_reuses_binder(self):
+        """Test that validate_and_extract_args builds one binder per function."""
+        from designer_plugin.d3sdk.ast_utils import _get_args_binder
+
+        def test_func(a, b):
+            pass
+
+        assert _get_args_binder(test_func) is _get_args_binder(test_func)
+
+    def test_validate_and_extract_args_signature_not_compiled(self):
+        """Test that Signature arguments, often built per call, skip code generation."""
+        from designer_plugin.d3sdk.ast_utils import validate_and_extract_args
+        import inspect
+
+        def test_func(a, b=10, *, c):
+            pass
+
+        with patch('designer_plugin.d3sdk.ast_utils.make_args_binder') as mock_make:
+            for _ in range(3):
+                positional, keyword = validate_and_extract_args(
+                    inspect.signature(test_func), (1,), {'c': 3}
+                )
+                assert positional == (1, 10)
+                assert keyword == {'c': 3}
+        mock_make.assert_not_called()
+
+    def test_var_keyword_call_shapes_bounded(self):
+        """Test that a **kwargs binder forgets call shapes once it has recorded enough."""
+        from designer_plugin.d3sdk import ast_utils
+        import inspect
+
+        def test_func(self, **kwargs):
+            pass
+
+        with (
+            patch.object(ast_utils, '_TEMPLATE_CACHE_SIZE', 4),
+            patch.object(ast_utils, '_extract_args', wraps=ast_utils._extract_args) as mock_extract,
+        ):
+            bind = ast_utils.make_args_binder(inspect.signature(test_func), is_method=True)
+            for i in range(4):
+                assert bind((), {f'k{i}': i}) == ((), {f'k{i}': i})
+            assert mock_extract.call_count == 4
+
+            # A recorded shape is reused without going back to Signature.bind()
+            assert bind((), {'k0': 5}) == ((), {'k0': 5})
+            assert mock_extract.call_count == 4
+
+            # A new shape past the limit is still validated, and older shapes are dropped
+            assert bind((), {'k4': 4}) == ((), {'k4': 4})
+            assert mock_extract.call_count == 5
+            assert bind((), {'k0': 6}) == ((), {'k0': 6})
+            assert mock_extract.call_count == 6
+
+    def test_function_signature_shared_with_get_signature(self):
+        """Test that binding a function reuses its cached signature."""
+        from designer_plugin.d3sdk.ast_utils import get_signature, make_args_binder
+        import inspect
+
+        def test_func(self, x, y=10, z=20):
+            pass
+
+        with patch('inspect.signature', wraps=inspect.signature) as mock_signature:
+            bind = make_args_binder(test_func, is_method=True)
+            get_signature(test_func)
+            assert bind((5,), {'z': 30}) == ((5, 10, 30), {})
+            mock_signature.assert_called_once()
+
+    def test_function_with_keyword_only(self):
+        """Test that functions with keyword-only parameters are bound correctly."""
+        from designer_plugin.d3sdk.ast_utils import make_args_binder
+
+        def test_func(self, a, b=5, *, c):
+            pass
+
+        bind = make_args_binder(test_func, is_method=True)
+        assert bind((1,), {'c': 'test'}) == ((1, 5), {'c': 'test'})
+        with pytest.raises(TypeError, match="missing a required argument"):
+            bind((1,), {})
+
 
 class TestModuleNameOverride:
     """Test suite for module_name override functionality."""
@@ -443,6 +714,42 @@ class TestModuleNameOverride:
             # Verify no override was set
             assert plugin._override_module_name is None
 
+    def test_register_payload_reused_across_sessions(self, plugin):
+        """Test that the registration payload is built once per module name."""
+        from designer_plugin.d3sdk import client
+
+        with (
+            patch('designer_plugin.d3sdk.client.d3_api_register_module') as mock_register,
+            patch(
+                'designer_plugin.d3sdk.client.RegisterPayload', wraps=client.RegisterPayload
+            ) as mock_payload,
+        ):
+            with plugin.session("localhost", 80):
+                pass
+            with plugin.session("localhost", 80):
+                pass
+            with plugin.session("localhost", 80, module_name="CustomModule"):
+                pass
+
+            # Built once for the default module name and once for the override
+            assert mock_payload.call_count == 2
+            payloads = [call[0][2] for call in mock_register.call_args_list]
+            assert payloads[0] == payloads[1]
+            assert payloads[2].moduleName == "CustomModule"
+            assert payloads[2].contents == payloads[0].contents
+
+    def test_register_payload_cache_not_mutated_by_callers(self, plugin):
+        """Test that changing a returned payload does not affect later sessions."""
+        first = plugin._get_register_module_payload()
+        first.contents = "changed"
+
+        with patch('designer_plugin.d3sdk.client.RegisterPayload') as mock_payload:
+            second = plugin._get_register_module_payload()
+            mock_payload.assert_not_called()
+
+        assert second.contents != "changed"
+        assert second.moduleName == plugin.module_name
+
     def test_override_cleared_on_exception(self, plugin):
         """Test that module_name override is cleared even if an exception occurs."""
         with patch('designer_plugin.d3sdk.client.d3_api_register_module', side_effect=Exception("Test error")):
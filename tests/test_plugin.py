@@ -3,10 +3,16 @@ MIT License
 Copyright (c) 2025 Disguise Technologies ltd
 """
 
+import asyncio
+import os
+import tempfile
+import threading
 from json import JSONDecodeError
 from json import dumps as json_dumps
-from unittest import TestCase
-from unittest.mock import mock_open, patch
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, Mock, mock_open, patch
+
+import designer_plugin.designer_plugin as designer_plugin_module
 
 from . import DesignerPlugin
 
@@ -20,7 +26,7 @@ class RegistrationTests(TestCase):
     def test_registration(self):
         """Test that the DesignerPlugin registers a service with Zeroconf."""
         with (
-            patch("designer_plugin.designer_plugin.Zeroconf") as _zeroconf
+            patch("zeroconf.Zeroconf") as _zeroconf
         ):
             with DesignerPlugin("test_name", 9999) as plugin:
                 pass
@@ -29,13 +35,204 @@ class RegistrationTests(TestCase):
             _zeroconf().register_service.assert_called_once()
             _zeroconf().close.assert_called_once()
 
+    def test_shared_zeroconf(self):
+        """Test that concurrently published plugins share one Zeroconf instance."""
+        with (
+            patch("zeroconf.Zeroconf") as _zeroconf
+        ):
+            with DesignerPlugin("first", 9998) as first:
+                with DesignerPlugin("second", 9999) as second:
+                    pass
+                _zeroconf.return_value.unregister_service.assert_called_once_with(second.service_info)
+                _zeroconf.return_value.close.assert_not_called()
+
+            _zeroconf.assert_called_once()
+            self.assertEqual(_zeroconf.return_value.register_service.call_count, 2)
+            _zeroconf.return_value.unregister_service.assert_called_with(first.service_info)
+            _zeroconf.return_value.close.assert_called_once()
+
+    def test_registered_service_unregistered_after_rename(self):
+        """Test that exit unregisters the registered service, even after a change."""
+        with (
+            patch("zeroconf.Zeroconf") as _zeroconf
+        ):
+            with DesignerPlugin("first", 9999) as plugin:
+                registered = _zeroconf.return_value.register_service.call_args.args[0]
+                plugin.name = "renamed"
+                plugin.port = 1234
+
+            _zeroconf.return_value.unregister_service.assert_called_once_with(registered)
+            self.assertEqual(registered.name, "first._d3plugin._tcp.local.")
+            self.assertIsNone(plugin._registration)
+
+    def test_service_info_cached(self):
+        """Test that the ServiceInfo is built once and reused."""
+        plugin = DesignerPlugin("test_name", 9999)
+        self.assertIs(plugin.service_info, plugin.service_info)
+
+    def test_service_info_rebuilt_when_attributes_change(self):
+        """Test that changing an advertised attribute is picked up on next registration."""
+        plugin = DesignerPlugin("test_name", 9999)
+        self.assertEqual(plugin.service_info.port, 9999)
+
+        plugin.port = 1234
+        plugin.requires_session = True
+        self.assertEqual(plugin.service_info.port, 1234)
+        self.assertEqual(plugin.service_info.properties[b"s"], b"true")
+
+    def test_default_hostname_cached(self):
+        """Test that the default hostname is not looked up per construction."""
+        try:
+            with patch("socket.gethostname", return_value="refreshed") as _gethostname:
+                plugin = DesignerPlugin("test_name", 9999)
+                _gethostname.assert_not_called()
+                self.assertEqual(plugin.hostname, designer_plugin_module._default_hostname)
+
+                self.assertEqual(designer_plugin_module.refresh_default_hostname(), "refreshed")
+                self.assertEqual(DesignerPlugin("test_name", 9999).hostname, "refreshed")
+        finally:
+            designer_plugin_module.refresh_default_hostname()
+
+    def test_set_url_rebuilds_service_info(self):
+        """Test that changing the URL updates the advertised properties."""
+        plugin = DesignerPlugin("test_name", 9999)
+        self.assertFalse(b"u" in plugin.service_info.properties)
+
+        plugin.set_url("http://my.plugin.url:9999")
+        self.assertEqual(plugin.url, "http://my.plugin.url:9999")
+        self.assertEqual(plugin.service_info.properties[b"u"], b"http://my.plugin.url:9999")
+
+
+class AsyncRegistrationTests(IsolatedAsyncioTestCase):
+    def _patch_async_zeroconf(self):
+        _azeroconf = patch("zeroconf.asyncio.AsyncZeroconf").start()
+        self.addCleanup(patch.stopall)
+        _azeroconf.return_value.async_register_service = AsyncMock(
+            side_effect=lambda info: asyncio.sleep(0)
+        )
+        _azeroconf.return_value.async_unregister_service = AsyncMock(
+            side_effect=lambda info: asyncio.sleep(0)
+        )
+        _azeroconf.return_value.async_close = AsyncMock()
+        return _azeroconf
+
+    async def test_async_registration_awaited(self):
+        """Test that the background registration is awaited before closing."""
+        _azeroconf = self._patch_async_zeroconf()
+
+        async with DesignerPlugin("test_name", 9999) as plugin:
+            self.assertIsNotNone(plugin._register_task)
+
+        _azeroconf().async_register_service.assert_awaited_once_with(plugin.service_info)
+        _azeroconf().async_unregister_service.assert_awaited_once_with(plugin.service_info)
+        _azeroconf().async_close.assert_awaited_once()
+        self.assertIsNone(plugin._register_task)
+
+    async def test_async_registered_service_unregistered_after_rename(self):
+        """Test that async exit unregisters the registered service, even after a change."""
+        _azeroconf = self._patch_async_zeroconf()
+
+        async with DesignerPlugin("first", 9999) as plugin:
+            plugin.name = "renamed"
+
+        registered = _azeroconf().async_register_service.call_args.args[0]
+        self.assertEqual(registered.name, "first._d3plugin._tcp.local.")
+        _azeroconf().async_unregister_service.assert_awaited_once_with(registered)
+        self.assertIsNone(plugin._registration)
+
+    async def test_async_announcement_awaited_before_unregister(self):
+        """Test that the registration's announcements finish before the goodbye."""
+        _azeroconf = self._patch_async_zeroconf()
+        events = []
+
+        async def announce():
+            events.append("announced")
+
+        def unregister(info):
+            events.append("unregistered")
+            return asyncio.sleep(0)
+
+        _azeroconf.return_value.async_register_service.side_effect = lambda info: announce()
+        _azeroconf.return_value.async_unregister_service.side_effect = unregister
+
+        async with DesignerPlugin("test_name", 9999):
+            pass
+
+        self.assertEqual(events, ["announced", "unregistered"])
+
+    async def test_async_shared_zeroconf(self):
+        """Test that concurrently published plugins share one AsyncZeroconf instance."""
+        _azeroconf = self._patch_async_zeroconf()
+
+        async with DesignerPlugin("first", 9998):
+            async with DesignerPlugin("second", 9999):
+                pass
+            _azeroconf.return_value.async_close.assert_not_awaited()
+
+        _azeroconf.assert_called_once()
+        self.assertEqual(_azeroconf.return_value.async_register_service.await_count, 2)
+        _azeroconf.return_value.async_close.assert_awaited_once()
+
+    def test_async_zeroconf_per_event_loop(self):
+        """Test that plugins on overlapping event loops get their own AsyncZeroconf."""
+        def create_azeroconf():
+            azeroconf = Mock()
+            azeroconf.async_register_service = AsyncMock(side_effect=lambda info: asyncio.sleep(0))
+            azeroconf.async_unregister_service = AsyncMock(side_effect=lambda info: asyncio.sleep(0))
+            azeroconf.async_close = AsyncMock()
+            return azeroconf
+
+        barrier = threading.Barrier(2, timeout=5)
+        used = {}
+
+        async def publish(name):
+            async with DesignerPlugin(name, 9999) as plugin:
+                used[name] = plugin._azeroconf
+                # Keep both plugins published at the same time, each on its own loop
+                barrier.wait()
+
+        with patch("zeroconf.asyncio.AsyncZeroconf", side_effect=create_azeroconf) as _azeroconf:
+            threads = [
+                threading.Thread(target=asyncio.run, args=(publish(name),))
+                for name in ("first", "second")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(_azeroconf.call_count, 2)
+        self.assertIsNot(used["first"], used["second"])
+        used["first"].async_close.assert_awaited_once()
+        used["second"].async_close.assert_awaited_once()
+
+    async def test_async_register_many(self):
+        """Test that several plugins are registered on one AsyncZeroconf instance."""
+        _azeroconf = self._patch_async_zeroconf()
+        announced = []
+
+        async def announce(info):
+            announced.append(info)
+
+        _azeroconf.return_value.async_register_service.side_effect = lambda info: announce(info)
+        plugins = [DesignerPlugin("first", 9998), DesignerPlugin("second", 9999)]
+
+        azeroconf = await DesignerPlugin.async_register_many(plugins)
+
+        self.assertEqual(announced, [plugin.service_info for plugin in plugins])
+
+        _azeroconf.assert_called_once()
+        self.assertIs(azeroconf, _azeroconf())
+        self.assertEqual(azeroconf.async_register_service.await_count, 2)
+        azeroconf.async_close.assert_not_awaited()
+
 
 class ParsingTests(TestCase):
     def test_file_path_exception(self):
         """Test that the DesignerPlugin.default_init raises a FileNotFoundError when the file is missing."""
         with (
             patch("builtins.open", mock_open()) as _open,
-            patch("designer_plugin.designer_plugin.Zeroconf") as _zeroconf
+            patch("zeroconf.Zeroconf") as _zeroconf
         ):
             _open.return_value.__enter__.side_effect = FileNotFoundError
 
@@ -46,7 +243,7 @@ class ParsingTests(TestCase):
         """Test that the DesignerPlugin raises a JSONDecodeError when the file is empty/invalid."""
         with (
             patch("builtins.open", mock_open(read_data='')) as _open,
-            patch("designer_plugin.designer_plugin.Zeroconf") as _zeroconf
+            patch("zeroconf.Zeroconf") as _zeroconf
         ):
             with self.assertRaises(JSONDecodeError):
                 DesignerPlugin.from_json_file('test.json', 9999)
@@ -55,7 +252,7 @@ class ParsingTests(TestCase):
         """Test that the DesignerPlugin registers a service with Zeroconf."""
         with (
             patch("builtins.open", mock_open()) as _open,
-            patch("designer_plugin.designer_plugin.Zeroconf") as _zeroconf
+            patch("zeroconf.Zeroconf") as _zeroconf
         ):
             _open.return_value.__enter__.side_effect = FileNotFoundError
             with DesignerPlugin("test_name", 9999) as plugin:
@@ -77,7 +274,7 @@ class ParsingTests(TestCase):
         })
         with (
             patch("builtins.open", mock_open(read_data=json)) as _open,
-            patch("designer_plugin.designer_plugin.Zeroconf") as _zeroconf
+            patch("zeroconf.Zeroconf") as _zeroconf
         ):
 
             with DesignerPlugin.default_init(9999) as plugin:
@@ -99,7 +296,7 @@ class ParsingTests(TestCase):
         })
         with (
             patch("builtins.open", mock_open(read_data=json)) as _open,
-            patch("designer_plugin.designer_plugin.Zeroconf") as _zeroconf
+            patch("zeroconf.Zeroconf") as _zeroconf
         ):
 
             with DesignerPlugin.default_init(9999) as plugin:
@@ -113,3 +310,75 @@ class ParsingTests(TestCase):
                 self.assertEqual(service_info.properties[b"u"], b"http://my.plugin.url:9999")
                 self.assertEqual(service_info.properties[b"t"], b"web")
                 self.assertEqual(service_info.properties[b"s"], b"false")
+
+    def test_options_file_memoized(self):
+        """Test that an unchanged options file is only parsed once."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "d3plugin.json")
+            with open(file_path, "w") as f:
+                f.write(json_dumps({"name": "Cached"}))
+
+            with patch(
+                "designer_plugin.designer_plugin._load_options",
+                wraps=designer_plugin_module._load_options,
+            ) as _load:
+                first = DesignerPlugin.from_json_file(file_path, 9999)
+                second = DesignerPlugin.from_json_file(file_path, 9999)
+
+            self.assertEqual(first.name, "Cached")
+            self.assertEqual(second.name, "Cached")
+            _load.assert_called_once()
+
+    def test_options_cache_file_reused(self):
+        """Test that a fresh process reuses the pre-parsed sidecar cache."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "d3plugin.json")
+            with open(file_path, "w") as f:
+                f.write(json_dumps({"name": "Sidecar", "requiresSession": True}))
+
+            DesignerPlugin.from_json_file(file_path, 9999)
+            self.assertTrue(
+                os.path.exists(file_path + designer_plugin_module.OPTIONS_CACHE_SUFFIX)
+            )
+
+            # Simulate a new process by dropping the in-memory cache
+            designer_plugin_module._load_options_cached.cache_clear()
+            with patch("designer_plugin.designer_plugin._load_options") as _load:
+                plugin = DesignerPlugin.from_json_file(file_path, 9999)
+
+            _load.assert_not_called()
+            self.assertEqual(plugin.name, "Sidecar")
+            self.assertTrue(plugin.requires_session)
+
+    def test_options_cache_file_invalidated(self):
+        """Test that the sidecar cache is ignored once the options file changes."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "d3plugin.json")
+            with open(file_path, "w") as f:
+                f.write(json_dumps({"name": "Old"}))
+            DesignerPlugin.from_json_file(file_path, 9999)
+
+            with open(file_path, "w") as f:
+                f.write(json_dumps({"name": "New name"}))
+            stat = os.stat(file_path)
+            os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            plugin = DesignerPlugin.from_json_file(file_path, 9999)
+            self.assertEqual(plugin.name, "New name")
+
+    def test_options_cache_file_invalidated_same_size_and_mtime(self):
+        """Test that a same-size rewrite keeping the old mtime is still noticed."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "d3plugin.json")
+            with open(file_path, "w") as f:
+                f.write(json_dumps({"name": "Old"}))
+            stat = os.stat(file_path)
+            DesignerPlugin.from_json_file(file_path, 9999)
+
+            with open(file_path, "w") as f:
+                f.write(json_dumps({"name": "New"}))
+            os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            designer_plugin_module._load_options_cached.cache_clear()
+            plugin = DesignerPlugin.from_json_file(file_path, 9999)
+            self.assertEqual(plugin.name, "New")